@@ -13,6 +13,22 @@ Usage:
 Then enter your model's metrics when prompted.
 """
 
+import sys
+
+# Report separators
+_BAR60 = "=" * 60
+_DASH40 = "-" * 40
+
+# Novel Attack Adaptability scores by architecture type
+NOVEL_ATTACK_SCORES = {
+    'attention': 90,  # Attention-based architectures
+    'hybrid': 80,     # Hybrid architectures (non-attention)
+    'traditional': 70  # Traditional ML models
+}
+
+# Same scores indexed by architecture menu choice - 1
+NOVEL_BY_CHOICE = tuple(NOVEL_ATTACK_SCORES.values())
+
 
 def calculate_tpr(true_positives: int = None, false_negatives: int = None, 
                   recall: float = None) -> float:
@@ -57,12 +73,7 @@ def get_novel_attack_score(architecture_type: str) -> int:
     Returns:
         Novel Attack Adaptability score (70, 80, or 90)
     """
-    scores = {
-        'attention': 90,  # Attention-based architectures
-        'hybrid': 80,     # Hybrid architectures (non-attention)
-        'traditional': 70  # Traditional ML models
-    }
-    return scores.get(architecture_type.lower(), 70)
+    return NOVEL_ATTACK_SCORES.get(architecture_type.lower(), 70)
 
 
 def calculate_inference_efficiency(model_inference_time: float, 
@@ -100,16 +111,16 @@ def calculate_asc(tpr: float, fpr_min: float, novel_attack: float,
 
 
 def main():
-    print("=" * 60)
+    print(_BAR60)
     print("  ATTACK SURFACE COVERAGE (ASC) CALCULATOR")
-    print("=" * 60)
+    print(_BAR60)
     print("\nThis calculator computes the ASC composite score for your IDS model.")
     print("Weights: TPR (35%), FPR_Min (35%), Novel Attack (15%), Inference (15%)\n")
     
     # Get user inputs
-    print("-" * 40)
+    print(_DASH40)
     print("DETECTION COVERAGE (TPR)")
-    print("-" * 40)
+    print(_DASH40)
     input_type = input("Do you have (1) Recall/TPR directly or (2) TP and FN counts? [1/2]: ").strip()
     
     if input_type == '2':
@@ -119,9 +130,9 @@ def main():
     else:
         tpr = float(input("Enter Recall/TPR (0-100%): "))
     
-    print("\n" + "-" * 40)
+    print("\n" + _DASH40)
     print("FALSE POSITIVE MINIMIZATION")
-    print("-" * 40)
+    print(_DASH40)
     fpr_input = input("Enter FPR as percentage (e.g., 0.002 for 0.002%) or decimal (e.g., 0.00002): ")
     fpr_value = float(fpr_input)
     
@@ -133,22 +144,21 @@ def main():
     
     fpr_min = calculate_fpr_min(fpr)
     
-    print("\n" + "-" * 40)
+    print("\n" + _DASH40)
     print("NOVEL ATTACK ADAPTABILITY")
-    print("-" * 40)
+    print(_DASH40)
     print("Architecture types and their scores:")
     print("  1. Attention-based (LSTM-CNN-Attention, Transformers): 90")
     print("  2. Hybrid (CNN-GRU-LSTM, CNN-LSTM, etc.): 80")
     print("  3. Traditional ML (Decision Trees, Random Forest, etc.): 70")
     
     arch_choice = input("\nSelect architecture type [1/2/3]: ").strip()
-    arch_map = {'1': 'attention', '2': 'hybrid', '3': 'traditional'}
-    architecture = arch_map.get(arch_choice, 'traditional')
-    novel_attack = get_novel_attack_score(architecture)
+    idx = int(arch_choice) - 1 if arch_choice in ('1', '2', '3') else 2
+    novel_attack = NOVEL_BY_CHOICE[idx]
     
-    print("\n" + "-" * 40)
+    print("\n" + _DASH40)
     print("INFERENCE EFFICIENCY")
-    print("-" * 40)
+    print(_DASH40)
     model_infer_time = float(input("Enter your model's inference time (seconds): "))
     fastest_infer_time = float(input("Enter fastest inference time among compared models (seconds): "))
     
@@ -158,45 +168,47 @@ def main():
     asc_score = calculate_asc(tpr, fpr_min, novel_attack, inference_eff)
     
     # Display results
-    print("\n" + "=" * 60)
-    print("  COMPONENT SCORES")
-    print("=" * 60)
-    print(f"  True Positive Rate (TPR):           {tpr:.2f}")
-    print(f"  False Positive Rate (FPR):          {fpr:.6f}")
-    print(f"  FPR Minimization (FPR_m):           {fpr_min:.4f}")
-    print(f"  Novel Attack Adaptability:          {novel_attack}")
-    print(f"  Inference Efficiency:               {inference_eff:.2f}")
-    
-    print("\n" + "=" * 60)
-    print("  WEIGHTED CONTRIBUTIONS")
-    print("=" * 60)
-    print(f"  TPR × 0.35:            {tpr:.2f} × 0.35 = {tpr * 0.35:.2f}")
-    print(f"  FPR_m × 0.35:          {fpr_min:.2f} × 0.35 = {fpr_min * 0.35:.2f}")
-    print(f"  Novel Attack × 0.15:   {novel_attack} × 0.15 = {novel_attack * 0.15:.2f}")
-    print(f"  Inference × 0.15:      {inference_eff:.2f} × 0.15 = {inference_eff * 0.15:.2f}")
-    
-    print("\n" + "=" * 60)
-    print("  ATTACK SURFACE COVERAGE SCORE")
-    print("=" * 60)
-    print(f"\n  ★ ASC SCORE: {asc_score:.2f}")
-    
-    print("\n  Formula: ASC = (0.35×TPR) + (0.35×FPR_m) + (0.15×N) + (0.15×I)")
-    print(f"         = (0.35×{tpr:.2f}) + (0.35×{fpr_min:.2f}) + (0.15×{novel_attack}) + (0.15×{inference_eff:.2f})")
-    print(f"         = {asc_score:.2f}")
+    lines = []
+    lines.append("\n" + _BAR60)
+    lines.append("  COMPONENT SCORES")
+    lines.append(_BAR60)
+    lines.append(f"  True Positive Rate (TPR):           {tpr:.2f}")
+    lines.append(f"  False Positive Rate (FPR):          {fpr:.6f}")
+    lines.append(f"  FPR Minimization (FPR_m):           {fpr_min:.4f}")
+    lines.append(f"  Novel Attack Adaptability:          {novel_attack}")
+    lines.append(f"  Inference Efficiency:               {inference_eff:.2f}")
+    
+    lines.append("\n" + _BAR60)
+    lines.append("  WEIGHTED CONTRIBUTIONS")
+    lines.append(_BAR60)
+    lines.append(f"  TPR × 0.35:            {tpr:.2f} × 0.35 = {tpr * 0.35:.2f}")
+    lines.append(f"  FPR_m × 0.35:          {fpr_min:.2f} × 0.35 = {fpr_min * 0.35:.2f}")
+    lines.append(f"  Novel Attack × 0.15:   {novel_attack} × 0.15 = {novel_attack * 0.15:.2f}")
+    lines.append(f"  Inference × 0.15:      {inference_eff:.2f} × 0.15 = {inference_eff * 0.15:.2f}")
+    
+    lines.append("\n" + _BAR60)
+    lines.append("  ATTACK SURFACE COVERAGE SCORE")
+    lines.append(_BAR60)
+    lines.append(f"\n  ★ ASC SCORE: {asc_score:.2f}")
+    
+    lines.append("\n  Formula: ASC = (0.35×TPR) + (0.35×FPR_m) + (0.15×N) + (0.15×I)")
+    lines.append(f"         = (0.35×{tpr:.2f}) + (0.35×{fpr_min:.2f}) + (0.15×{novel_attack}) + (0.15×{inference_eff:.2f})")
+    lines.append(f"         = {asc_score:.2f}")
     
     # Interpretation
-    print("\n" + "-" * 40)
-    print("INTERPRETATION")
-    print("-" * 40)
+    lines.append("\n" + _DASH40)
+    lines.append("INTERPRETATION")
+    lines.append(_DASH40)
     if asc_score >= 97:
-        print("  Excellent security coverage - suitable for high-security IIoT environments")
+        lines.append("  Excellent security coverage - suitable for high-security IIoT environments")
     elif asc_score >= 95:
-        print("  Very good security coverage - suitable for most industrial deployments")
+        lines.append("  Very good security coverage - suitable for most industrial deployments")
     elif asc_score >= 90:
-        print("  Good security coverage - adequate for standard IIoT applications")
+        lines.append("  Good security coverage - adequate for standard IIoT applications")
     else:
-        print("  Moderate security coverage - consider improvements for critical infrastructure")
+        lines.append("  Moderate security coverage - consider improvements for critical infrastructure")
     
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -9,28 +9,54 @@ This script provides a unified interface to run all evaluation calculators:
 
 Usage:
     python main_calculator.py
+    python main_calculator.py --config models.json
 """
 
 import sys
 import os
+import json
+import argparse
+import importlib.util
+
+import numpy as np
 
 # Add current directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+
+from pfo_calculator import (calculate_detection_score, calculate_efficiency_score,
+                            calculate_deployment_score, calculate_composite_pfo_batch)
+from asc_calculator import (calculate_fpr_min, calculate_inference_efficiency, calculate_asc,
+                            NOVEL_BY_CHOICE)
+from tco_calculator import calculate_tco_batch, parse_interp
+
+# Report separators
+_BAR70 = "=" * 70
+_BAR50 = "=" * 50
+_DASH70 = "-" * 70
+_DASH50 = "-" * 50
+
+# Per-model inputs consumed by evaluate_batch
+MODEL_COLUMNS = ('accuracy', 'f1', 'training_time', 'inference_time', 'model_size',
+                 'is_edge', 'recall', 'fpr', 'arch', 'interp')
+
+# Answers accepted as "yes" for yes/no inputs
+_YES = ('yes', 'y', 'true', '1')
 
 
 def print_header():
     """Print the main header."""
-    print("\n" + "=" * 70)
+    print("\n" + _BAR70)
     print("  IDS MULTI-DIMENSIONAL EVALUATION FRAMEWORK")
     print("  Calculator Suite for Intrusion Detection System Evaluation")
-    print("=" * 70)
+    print(_BAR70)
 
 
 def print_menu():
     """Print the main menu."""
-    print("\n" + "-" * 50)
+    print("\n" + _DASH50)
     print("  AVAILABLE CALCULATORS")
-    print("-" * 50)
+    print(_DASH50)
     print("  1. PFO Calculator - Pareto Frontier Optimization")
     print("     (Detection, Efficiency, Deployment trade-offs)")
     print()
@@ -47,239 +73,394 @@ def print_menu():
     print("     (Full evaluation pipeline)")
     print()
     print("  0. Exit")
-    print("-" * 50)
+    print(_DASH50)
+
+
+def _lazy_module(name: str, path: str):
+    """
+    Load a calculator module once and return its main() function.
+    
+    Args:
+        name: Module name to register in sys.modules
+        path: Source file of the module
+    
+    Returns:
+        The module's main() function
+    """
+    mod = sys.modules.get(name)
+    if mod is None:
+        spec = importlib.util.spec_from_file_location(name, path)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[name] = mod
+        spec.loader.exec_module(mod)
+    return mod.main
 
 
 def run_pfo():
     """Run PFO calculator."""
-    try:
-        from pfo_calculator import main as pfo_main
-        pfo_main()
-    except ImportError:
-        exec(open('pfo_calculator.py').read())
+    _lazy_module('pfo_calculator', os.path.join(BASE_DIR, 'pfo_calculator.py'))()
 
 
 def run_asc():
     """Run ASC calculator."""
-    try:
-        from asc_calculator import main as asc_main
-        asc_main()
-    except ImportError:
-        exec(open('asc_calculator.py').read())
+    _lazy_module('asc_calculator', os.path.join(BASE_DIR, 'asc_calculator.py'))()
 
 
 def run_tco():
     """Run TCO calculator."""
-    try:
-        from tco_calculator import main as tco_main
-        tco_main()
-    except ImportError:
-        exec(open('tco_calculator.py').read())
+    _lazy_module('tco_calculator', os.path.join(BASE_DIR, 'tco_calculator.py'))([])
 
 
 def run_synthesis():
     """Run Synthesis Engine calculator."""
-    try:
-        from synthesis_calculator import main as synthesis_main
-        synthesis_main()
-    except ImportError:
-        exec(open('synthesis_calculator.py').read())
+    _lazy_module('synthesis_calculator', os.path.join(BASE_DIR, 'synthesis_calculator.py'))([])
 
 
-def run_complete_evaluation():
-    """Run complete evaluation with all metrics collected."""
-    print("\n" + "=" * 70)
-    print("  COMPLETE MODEL EVALUATION")
-    print("=" * 70)
-    print("\nThis will collect all required metrics and compute all scores.\n")
+def _parse_flags(values) -> np.ndarray:
+    """
+    Parse yes/no flags (bools, numbers or strings such as 'yes'/'no')
+    into a boolean array.
+    
+    Args:
+        values: Flag values, shape (N,)
+    
+    Returns:
+        Boolean array of shape (N,)
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind in 'biuf':
+        return arr != 0
+    return np.isin(np.char.lower(np.char.strip(arr.astype(str))), _YES)
+
+
+def evaluate_batch(data, fastest_infer: float = None) -> dict:
+    """
+    Compute PFO, ASC and TCO scores for N models at once.
+    
+    Args:
+        data: pandas DataFrame, dict of equal-length arrays, or list of
+              per-model dicts with keys accuracy, f1, training_time,
+              inference_time, model_size, is_edge, recall, fpr,
+              arch (1/2/3), interp (1/2/3)
+        fastest_infer: Fastest inference time for ASC normalization
+                       (defaults to the fastest model in the batch)
+    
+    Returns:
+        Dictionary of float64 arrays, one entry per score/cost component
+    """
+    if isinstance(data, list):
+        data = {key: [m[key] for m in data] for key in MODEL_COLUMNS}
+    
+    accuracy = np.asarray(data['accuracy'], dtype=np.float64)
+    f1 = np.asarray(data['f1'], dtype=np.float64)
+    training_time = np.asarray(data['training_time'], dtype=np.float64)
+    inference_time = np.asarray(data['inference_time'], dtype=np.float64)
+    model_size = np.asarray(data['model_size'], dtype=np.float64)
+    is_edge = _parse_flags(data['is_edge'])
+    recall = np.asarray(data['recall'], dtype=np.float64)
+    fpr = np.asarray(data['fpr'], dtype=np.float64)
+    arch = np.asarray(data['arch'], dtype=np.intp)
+    interp = np.asarray(data['interp'], dtype=np.intp)
+    
+    if fastest_infer is None:
+        fastest_infer = inference_time.min()
+    
+    # PFO Calculations (calculator kernels broadcast over the arrays)
+    detection = calculate_detection_score(accuracy, f1)
+    efficiency = calculate_efficiency_score(training_time, inference_time)
+    edge_score = np.where(is_edge, 1.0, np.where(model_size < 10, 0.8, 0.2))
+    deployment = calculate_deployment_score(model_size, edge_score)
+    pfo_composite = calculate_composite_pfo_batch(detection, efficiency, deployment)
+    
+    # ASC Calculations
+    novel_attack = np.select([arch == 1, arch == 2], NOVEL_BY_CHOICE[:2], NOVEL_BY_CHOICE[2])
+    fpr_min = calculate_fpr_min(fpr)
+    inference_eff = calculate_inference_efficiency(inference_time, fastest_infer)
+    asc = calculate_asc(recall, fpr_min, novel_attack, inference_eff)
+    
+    # TCO Calculations (using tco_calculator's default parameters)
+    interp_idx = np.select([interp == 1, interp == 2], [0, 1], 2)
+    costs = calculate_tco_batch(model_size, training_time, inference_time, fpr,
+                                is_edge, edge_score, interp_idx)
+    
+    return {
+        'detection': detection,
+        'efficiency': efficiency,
+        'edge_score': edge_score,
+        'deployment': deployment,
+        'pfo_composite': pfo_composite,
+        'tpr': recall,
+        'fpr_min': fpr_min,
+        'novel_attack': novel_attack,
+        'inference_eff': inference_eff,
+        'asc': asc,
+        'dep_cost': costs['deployment'],
+        'op_cost': costs['operational'],
+        'ir_cost': costs['incident_response'],
+        'sc_cost': costs['scalability'],
+        'cc_cost': costs['compliance'],
+        'tco': costs['total']
+    }
+
+
+def _collect_inputs(source: dict = None) -> dict:
+    """
+    Collect the metrics for one model.
+    
+    Args:
+        source: Pre-parsed inputs (e.g. one model from a --config file);
+                the user is prompted on stdin when omitted
     
-    # Collect all inputs once
-    print("-" * 50)
+    Returns:
+        Dictionary of model inputs keyed as expected by evaluate_batch,
+        plus 'name' and 'fastest_infer'
+    """
+    if source is not None:
+        # Coerce the config values the same way the prompts below do
+        inputs = dict(source)
+        for key in ('accuracy', 'f1', 'training_time', 'inference_time', 'model_size',
+                    'recall', 'fpr'):
+            inputs[key] = float(inputs[key])
+        inputs['is_edge'] = str(inputs['is_edge']).strip().lower() in _YES
+        inputs['arch'] = int(inputs['arch'])
+        inputs['interp'] = parse_interp(inputs['interp']) + 1
+        inputs['fastest_infer'] = float(inputs.get('fastest_infer', inputs['inference_time']))
+        inputs['save'] = str(inputs.get('save', False)).strip().lower() in _YES
+        inputs.setdefault('name', 'model')
+        return inputs
+    
+    print(_DASH50)
     print("MODEL IDENTIFICATION")
-    print("-" * 50)
+    print(_DASH50)
     model_name = input("Enter model name: ")
     
-    print("\n" + "-" * 50)
+    print("\n" + _DASH50)
     print("DETECTION METRICS")
-    print("-" * 50)
+    print(_DASH50)
     accuracy = float(input("Accuracy (0-100%): "))
     f1_score = float(input("F1-Score (0-100%): "))
     
-    print("\n" + "-" * 50)
+    print("\n" + _DASH50)
     print("EFFICIENCY METRICS")
-    print("-" * 50)
+    print(_DASH50)
     training_time = float(input("Training Time (seconds): "))
     inference_time = float(input("Inference Time per sample (seconds): "))
     
-    print("\n" + "-" * 50)
+    print("\n" + _DASH50)
     print("DEPLOYMENT METRICS")
-    print("-" * 50)
+    print(_DASH50)
     model_size = float(input("Model Size (MB): "))
     edge_input = input("Is edge-deployable? (yes/no): ").strip().lower()
     is_edge = edge_input in ['yes', 'y', 'true', '1']
     
-    if is_edge:
-        edge_score = 1.0
-    elif model_size < 10:
-        edge_score = 0.8
-    else:
-        edge_score = 0.2
-    
-    print("\n" + "-" * 50)
+    print("\n" + _DASH50)
     print("SECURITY METRICS")
-    print("-" * 50)
+    print(_DASH50)
     recall = float(input("Recall/TPR (0-100%): "))
-    fpr_input = input("False Positive Rate (e.g., 0.002 for 0.2%): ")
-    fpr = float(fpr_input)
+    fpr = float(input("False Positive Rate (e.g., 0.002 for 0.2%): "))
     
     print("\n  Architecture types:")
     print("  1. Attention-based (Score: 90)")
     print("  2. Hybrid (Score: 80)")
     print("  3. Traditional ML (Score: 70)")
     arch_choice = input("Select architecture [1/2/3]: ").strip()
-    arch_scores = {'1': 90, '2': 80, '3': 70}
-    novel_attack = arch_scores.get(arch_choice, 70)
     
-    print("\n" + "-" * 50)
+    print("\n" + _DASH50)
     print("INTERPRETABILITY")
-    print("-" * 50)
+    print(_DASH50)
     print("  1. High (Decision Trees, Rule-based)")
     print("  2. Medium (Hybrid with some explainability)")
     print("  3. Low (Deep neural networks)")
     interp_choice = input("Select level [1/2/3]: ").strip()
-    interp_map = {'1': ('high', 1.0), '2': ('medium', 0.5), '3': ('low', 0.2)}
-    interp_label, interp_score = interp_map.get(interp_choice, ('low', 0.2))
     
-    print("\n" + "-" * 50)
+    print("\n" + _DASH50)
     print("COMPARISON CONTEXT (for normalization)")
-    print("-" * 50)
+    print(_DASH50)
     fastest_infer = float(input("Fastest inference time among all models (seconds): "))
     
+    return {
+        'name': model_name,
+        'accuracy': accuracy,
+        'f1': f1_score,
+        'training_time': training_time,
+        'inference_time': inference_time,
+        'model_size': model_size,
+        'is_edge': is_edge,
+        'recall': recall,
+        'fpr': fpr,
+        'arch': int(arch_choice) if arch_choice.isdigit() else 3,
+        'interp': int(interp_choice) if interp_choice.isdigit() else 3,
+        'fastest_infer': fastest_infer
+    }
+
+
+def run_complete_evaluation(inputs: dict = None):
+    """
+    Run complete evaluation with all metrics collected.
+    
+    Args:
+        inputs: Model inputs as returned by _collect_inputs; prompts
+                interactively when omitted
+    """
+    print("\n" + _BAR70)
+    print("  COMPLETE MODEL EVALUATION")
+    print(_BAR70)
+    
+    if inputs is None:
+        print("\nThis will collect all required metrics and compute all scores.\n")
+        inputs = _collect_inputs()
+    model_name = inputs['name']
+    
     # ============ CALCULATIONS ============
     
-    # PFO Calculations
-    detection_score = (accuracy * f1_score) / 10000
-    efficiency_score = (1 / training_time) * (1 / inference_time)
-    deployment_score = (1 / model_size) * edge_score
+    r = evaluate_batch([inputs], fastest_infer=inputs['fastest_infer'])
     
-    # ASC Calculations
-    tpr = recall
-    fpr_min = (1 - fpr) * 100
-    inference_eff = (fastest_infer / inference_time) * 100
-    asc_score = (0.35 * tpr) + (0.35 * fpr_min) + (0.15 * novel_attack) + (0.15 * inference_eff)
-    
-    # TCO Calculations (using default parameters)
-    N, Y, F = 1000, 5, 10000
-    
-    # Deployment Cost
-    c_infra = 50000
-    c_hw = 350 * model_size
-    c_net = 10000 if is_edge else 50000
-    c_int = 20000 if is_edge else 100000
-    dep_cost = c_infra + c_hw + c_net + c_int
-    
-    # Operational Cost
-    training_hours = training_time / 3600
-    c_train = training_hours * N * 1 * Y * 2
-    total_flows = F * N * 365 * Y
-    c_infer = (total_flows * inference_time / 3600) * 0.5
-    c_energy = 90 * N * Y
-    op_cost = c_train + c_infer + c_energy
-    
-    # Incident Response Cost
-    false_alerts = fpr * total_flows
-    cost_per_alert = (10/60) * 75
-    ir_cost = false_alerts * cost_per_alert
-    
-    # Scalability Cost
-    if is_edge:
-        sc_cost = 80000 * edge_score
-    else:
-        sc_cost = 50000
-    
-    # Compliance Cost
-    opacity = 1 / interp_score
-    cc_cost = 120000 * opacity
-    
-    # Total TCO
-    tco = dep_cost + op_cost + ir_cost + sc_cost + cc_cost
+    detection_score = float(r['detection'][0])
+    efficiency_score = float(r['efficiency'][0])
+    deployment_score = float(r['deployment'][0])
+    edge_score = float(r['edge_score'][0])
+    tpr = float(r['tpr'][0])
+    fpr_min = float(r['fpr_min'][0])
+    novel_attack = int(r['novel_attack'][0])
+    inference_eff = float(r['inference_eff'][0])
+    asc_score = float(r['asc'][0])
+    dep_cost = float(r['dep_cost'][0])
+    op_cost = float(r['op_cost'][0])
+    ir_cost = float(r['ir_cost'][0])
+    sc_cost = float(r['sc_cost'][0])
+    cc_cost = float(r['cc_cost'][0])
+    tco = float(r['tco'][0])
     
     # ============ DISPLAY RESULTS ============
     
-    print("\n" + "=" * 70)
-    print(f"  EVALUATION RESULTS: {model_name}")
-    print("=" * 70)
-    
-    print("\n" + "-" * 50)
-    print("  PFO SCORES")
-    print("-" * 50)
-    print(f"  Detection Score (D):      {detection_score:.6f}")
-    print(f"  Efficiency Score (E):     {efficiency_score:.6f}")
-    print(f"  Deployment Score (P):     {deployment_score:.6f}")
-    print(f"  Edge Compatibility (α):   {edge_score}")
-    
-    print("\n" + "-" * 50)
-    print("  ASC SCORES")
-    print("-" * 50)
-    print(f"  TPR (Detection Coverage): {tpr:.2f}")
-    print(f"  FPR Minimization:         {fpr_min:.4f}")
-    print(f"  Novel Attack Score:       {novel_attack}")
-    print(f"  Inference Efficiency:     {inference_eff:.2f}")
-    print(f"  ─────────────────────────────")
-    print(f"  ★ ASC COMPOSITE SCORE:    {asc_score:.2f}")
-    
-    print("\n" + "-" * 50)
-    print("  TCO BREAKDOWN (5-Year)")
-    print("-" * 50)
-    print(f"  Deployment (DEP):         ${dep_cost:,.0f}")
-    print(f"  Operational (OP):         ${op_cost:,.0f}")
-    print(f"  Incident Response (IR):   ${ir_cost:,.0f}")
-    print(f"  Scalability (SC):         ${sc_cost:,.0f}")
-    print(f"  Compliance (CC):          ${cc_cost:,.0f}")
-    print(f"  ─────────────────────────────")
-    print(f"  ★ TOTAL 5-YEAR TCO:       ${tco:,.0f}")
-    
-    print("\n" + "-" * 50)
-    print("  SUMMARY METRICS")
-    print("-" * 50)
-    print(f"  Detection Score:          {detection_score:.4f} (target: 1.0)")
-    print(f"  ASC Score:                {asc_score:.2f} (target: 100)")
-    print(f"  5-Year TCO:               ${tco:,.0f}")
-    
-    print("\n" + "=" * 70)
-    print("  NOTE: For final ranking, use the Synthesis Engine (Option 4)")
-    print("  with normalized scores from multiple model comparison.")
-    print("=" * 70)
-    
-    # Ask to save results
-    save = input("\nSave results to file? (yes/no): ").strip().lower()
-    if save in ['yes', 'y']:
+    lines = []
+    lines.append("\n" + _BAR70)
+    lines.append(f"  EVALUATION RESULTS: {model_name}")
+    lines.append(_BAR70)
+    
+    lines.append("\n" + _DASH50)
+    lines.append("  PFO SCORES")
+    lines.append(_DASH50)
+    lines.append(f"  Detection Score (D):      {detection_score:.6f}")
+    lines.append(f"  Efficiency Score (E):     {efficiency_score:.6f}")
+    lines.append(f"  Deployment Score (P):     {deployment_score:.6f}")
+    lines.append(f"  Edge Compatibility (α):   {edge_score}")
+    
+    lines.append("\n" + _DASH50)
+    lines.append("  ASC SCORES")
+    lines.append(_DASH50)
+    lines.append(f"  TPR (Detection Coverage): {tpr:.2f}")
+    lines.append(f"  FPR Minimization:         {fpr_min:.4f}")
+    lines.append(f"  Novel Attack Score:       {novel_attack}")
+    lines.append(f"  Inference Efficiency:     {inference_eff:.2f}")
+    lines.append(f"  ─────────────────────────────")
+    lines.append(f"  ★ ASC COMPOSITE SCORE:    {asc_score:.2f}")
+    
+    lines.append("\n" + _DASH50)
+    lines.append("  TCO BREAKDOWN (5-Year)")
+    lines.append(_DASH50)
+    lines.append(f"  Deployment (DEP):         ${dep_cost:,.0f}")
+    lines.append(f"  Operational (OP):         ${op_cost:,.0f}")
+    lines.append(f"  Incident Response (IR):   ${ir_cost:,.0f}")
+    lines.append(f"  Scalability (SC):         ${sc_cost:,.0f}")
+    lines.append(f"  Compliance (CC):          ${cc_cost:,.0f}")
+    lines.append(f"  ─────────────────────────────")
+    lines.append(f"  ★ TOTAL 5-YEAR TCO:       ${tco:,.0f}")
+    
+    lines.append("\n" + _DASH50)
+    lines.append("  SUMMARY METRICS")
+    lines.append(_DASH50)
+    lines.append(f"  Detection Score:          {detection_score:.4f} (target: 1.0)")
+    lines.append(f"  ASC Score:                {asc_score:.2f} (target: 100)")
+    lines.append(f"  5-Year TCO:               ${tco:,.0f}")
+    
+    lines.append("\n" + _BAR70)
+    lines.append("  NOTE: For final ranking, use the Synthesis Engine (Option 4)")
+    lines.append("  with normalized scores from multiple model comparison.")
+    lines.append(_BAR70)
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Ask to save results (config runs set 'save' instead)
+    save = inputs.get('save')
+    if save is None:
+        save = input("\nSave results to file? (yes/no): ").strip().lower() in ['yes', 'y']
+    if save:
         filename = f"{model_name.replace(' ', '_')}_evaluation.txt"
+        report = (
+            f"IDS EVALUATION RESULTS: {model_name}\n"
+            f"{_BAR50}\n\n"
+            f"Detection Score: {detection_score:.6f}\n"
+            f"ASC Score: {asc_score:.2f}\n"
+            f"5-Year TCO: ${tco:,.0f}\n"
+            f"\nPFO Components:\n"
+            f"  Efficiency: {efficiency_score:.6f}\n"
+            f"  Deployment: {deployment_score:.6f}\n"
+            f"\nASC Components:\n"
+            f"  TPR: {tpr:.2f}\n"
+            f"  FPR_Min: {fpr_min:.4f}\n"
+            f"  Novel Attack: {novel_attack}\n"
+            f"  Inference Eff: {inference_eff:.2f}\n"
+            f"\nTCO Components:\n"
+            f"  DEP: ${dep_cost:,.0f}\n"
+            f"  OP: ${op_cost:,.0f}\n"
+            f"  IR: ${ir_cost:,.0f}\n"
+            f"  SC: ${sc_cost:,.0f}\n"
+            f"  CC: ${cc_cost:,.0f}\n"
+        )
         with open(filename, 'w') as f:
-            f.write(f"IDS EVALUATION RESULTS: {model_name}\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Detection Score: {detection_score:.6f}\n")
-            f.write(f"ASC Score: {asc_score:.2f}\n")
-            f.write(f"5-Year TCO: ${tco:,.0f}\n")
-            f.write(f"\nPFO Components:\n")
-            f.write(f"  Efficiency: {efficiency_score:.6f}\n")
-            f.write(f"  Deployment: {deployment_score:.6f}\n")
-            f.write(f"\nASC Components:\n")
-            f.write(f"  TPR: {tpr:.2f}\n")
-            f.write(f"  FPR_Min: {fpr_min:.4f}\n")
-            f.write(f"  Novel Attack: {novel_attack}\n")
-            f.write(f"  Inference Eff: {inference_eff:.2f}\n")
-            f.write(f"\nTCO Components:\n")
-            f.write(f"  DEP: ${dep_cost:,.0f}\n")
-            f.write(f"  OP: ${op_cost:,.0f}\n")
-            f.write(f"  IR: ${ir_cost:,.0f}\n")
-            f.write(f"  SC: ${sc_cost:,.0f}\n")
-            f.write(f"  CC: ${cc_cost:,.0f}\n")
+            f.write(report)
         print(f"  Results saved to: {filename}")
 
 
-def main():
+def run_batch_evaluation(models: list):
+    """
+    Evaluate a list of models non-interactively in one vectorized pass.
+    
+    Inference efficiency is normalized against the fastest model in the
+    batch, or against a model's 'fastest_infer' if that is faster still.
+    
+    Args:
+        models: Model input dicts (see _collect_inputs)
+    """
+    if not models:
+        print("\n  ⚠️  No models to evaluate.")
+        return
+    
+    r = evaluate_batch(models, fastest_infer=min(m['fastest_infer'] for m in models))
+    
+    lines = []
+    lines.append("\n" + _BAR70)
+    lines.append(f"  BATCH EVALUATION RESULTS ({len(models)} models)")
+    lines.append(_BAR70)
+    lines.append(f"{'Model':<25} | {'Det.':>7} | {'PFO':>7} | {'ASC':>7} | {'5-Year TCO':>15}")
+    lines.append(_DASH70)
+    for i, m in enumerate(models):
+        tco = f"${r['tco'][i]:,.0f}"
+        lines.append(f"{m['name']:<25} | {r['detection'][i]:>7.4f} | "
+                     f"{r['pfo_composite'][i]:>7.4f} | {r['asc'][i]:>7.2f} | {tco:>15}")
+    lines.append("\n  PFO composite is normalized across this batch.")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def main(argv: list = None):
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="IDS evaluation calculator suite")
+    parser.add_argument('--config', metavar='PATH',
+                        help="JSON file with one model (object) or many (list); '-' reads stdin")
+    args = parser.parse_args(argv)
+    
+    if args.config:
+        if args.config == '-':
+            config = json.load(sys.stdin)
+        else:
+            with open(args.config) as f:
+                config = json.load(f)
+        if isinstance(config, list):
+            run_batch_evaluation([_collect_inputs(m) for m in config])
+        else:
+            run_complete_evaluation(_collect_inputs(config))
+        return
+    
     print_header()
     
     while True:
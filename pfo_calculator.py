@@ -12,6 +12,14 @@ Usage:
 Then enter your model's metrics when prompted.
 """
 
+import sys
+
+import numpy as np
+
+# Report separators
+_BAR60 = "=" * 60
+_DASH40 = "-" * 40
+
 
 def calculate_detection_score(accuracy: float, f1_score: float) -> float:
     """
@@ -107,29 +115,67 @@ def calculate_composite_pfo(detection: float, efficiency_norm: float, deployment
     return (1/3) * detection + (1/3) * efficiency_norm + (1/3) * deployment_norm
 
 
+def normalize_array(arr: np.ndarray) -> np.ndarray:
+    """
+    Min-max normalize each column of a score array to 0-1 range.
+    Equation: S_n = (S - S_min) / (S_max - S_min), with S_min/S_max per column
+    
+    Args:
+        arr: Raw scores, shape (N,) or (N, k) for N models
+    
+    Returns:
+        Normalized scores of the same shape (0.0 where a column is constant)
+    """
+    arr = np.asarray(arr, dtype=np.float64)
+    lo = arr.min(axis=0)
+    ptp = arr.max(axis=0) - lo
+    return np.where(ptp == 0, 0.0, (arr - lo) / np.where(ptp == 0, 1, ptp))
+
+
+def calculate_composite_pfo_batch(detection: np.ndarray, efficiency: np.ndarray,
+                                  deployment: np.ndarray) -> np.ndarray:
+    """
+    Calculate Composite PFO Scores for a set of models, normalizing
+    Efficiency and Deployment against each other within the set.
+    Equation: C = mean(D, E_n, P_n)
+    
+    Args:
+        detection: Detection Scores (already 0-1 range)
+        efficiency: Raw Efficiency Scores
+        deployment: Raw Deployment Scores
+    
+    Returns:
+        Composite PFO Score per model
+    """
+    scores_norm = np.column_stack((
+        detection, normalize_array(np.column_stack((efficiency, deployment)))
+    ))
+    return scores_norm.mean(axis=1)
+
+
 def main():
-    print("=" * 60)
+    print(_BAR60)
     print("  PARETO FRONTIER OPTIMIZATION (PFO) CALCULATOR")
-    print("=" * 60)
+    print(_BAR60)
     print("\nThis calculator computes the PFO composite score for your IDS model.")
     print("Equal weights (33.33% each) are applied to Detection, Efficiency, and Deployment.\n")
     
     # Get user inputs
-    print("-" * 40)
+    print(_DASH40)
     print("DETECTION PERFORMANCE METRICS")
-    print("-" * 40)
+    print(_DASH40)
     accuracy = float(input("Enter Accuracy (0-100%): "))
     f1_score = float(input("Enter F1-Score (0-100%): "))
     
-    print("\n" + "-" * 40)
+    print("\n" + _DASH40)
     print("COMPUTATIONAL EFFICIENCY METRICS")
-    print("-" * 40)
+    print(_DASH40)
     training_time = float(input("Enter Training Time (seconds): "))
     inference_time = float(input("Enter Inference Time (seconds): "))
     
-    print("\n" + "-" * 40)
+    print("\n" + _DASH40)
     print("DEPLOYMENT FEASIBILITY METRICS")
-    print("-" * 40)
+    print(_DASH40)
     model_size = float(input("Enter Model Size (MB): "))
     edge_input = input("Is the model edge-deployable? (yes/no): ").strip().lower()
     is_edge_deployable = edge_input in ['yes', 'y', 'true', '1']
@@ -140,19 +186,21 @@ def main():
     edge_compatibility = get_edge_compatibility(is_edge_deployable, model_size)
     deployment_score = calculate_deployment_score(model_size, edge_compatibility)
     
-    print("\n" + "=" * 60)
-    print("  RAW SCORES")
-    print("=" * 60)
-    print(f"  Detection Score (D):     {detection_score:.6f}")
-    print(f"  Efficiency Score (E):    {efficiency_score:.6f}")
-    print(f"  Deployment Score (P):    {deployment_score:.6f}")
-    print(f"  Edge Compatibility (α):  {edge_compatibility}")
+    lines = []
+    lines.append("\n" + _BAR60)
+    lines.append("  RAW SCORES")
+    lines.append(_BAR60)
+    lines.append(f"  Detection Score (D):     {detection_score:.6f}")
+    lines.append(f"  Efficiency Score (E):    {efficiency_score:.6f}")
+    lines.append(f"  Deployment Score (P):    {deployment_score:.6f}")
+    lines.append(f"  Edge Compatibility (α):  {edge_compatibility}")
     
     # For single model, show unnormalized composite
     # In practice, normalization requires comparison with other models
-    print("\n" + "-" * 40)
-    print("NORMALIZATION (For comparison with other models)")
-    print("-" * 40)
+    lines.append("\n" + _DASH40)
+    lines.append("NORMALIZATION (For comparison with other models)")
+    lines.append(_DASH40)
+    sys.stdout.write("\n".join(lines) + "\n")
     
     compare = input("\nDo you want to compare with baseline models? (yes/no): ").strip().lower()
     
@@ -168,25 +216,29 @@ def main():
         
         composite_pfo = calculate_composite_pfo(detection_score, efficiency_norm, deployment_norm)
         
-        print("\n" + "=" * 60)
-        print("  NORMALIZED SCORES")
-        print("=" * 60)
-        print(f"  Efficiency Normalized (E_n):  {efficiency_norm:.6f}")
-        print(f"  Deployment Normalized (P_n):  {deployment_norm:.6f}")
+        lines = []
+        lines.append("\n" + _BAR60)
+        lines.append("  NORMALIZED SCORES")
+        lines.append(_BAR60)
+        lines.append(f"  Efficiency Normalized (E_n):  {efficiency_norm:.6f}")
+        lines.append(f"  Deployment Normalized (P_n):  {deployment_norm:.6f}")
         
-        print("\n" + "=" * 60)
-        print("  COMPOSITE PFO SCORE")
-        print("=" * 60)
-        print(f"\n  ★ COMPOSITE PFO SCORE: {composite_pfo:.4f}")
-        print(f"\n  Formula: C = (1/3)×{detection_score:.4f} + (1/3)×{efficiency_norm:.4f} + (1/3)×{deployment_norm:.4f}")
+        lines.append("\n" + _BAR60)
+        lines.append("  COMPOSITE PFO SCORE")
+        lines.append(_BAR60)
+        lines.append(f"\n  ★ COMPOSITE PFO SCORE: {composite_pfo:.4f}")
+        lines.append(f"\n  Formula: C = (1/3)×{detection_score:.4f} + (1/3)×{efficiency_norm:.4f} + (1/3)×{deployment_norm:.4f}")
+        sys.stdout.write("\n".join(lines) + "\n")
     else:
-        print("\n" + "=" * 60)
-        print("  STANDALONE COMPOSITE (Using raw scores)")
-        print("=" * 60)
+        lines = []
+        lines.append("\n" + _BAR60)
+        lines.append("  STANDALONE COMPOSITE (Using raw scores)")
+        lines.append(_BAR60)
         # Use raw scores scaled to 0-1 for standalone evaluation
         composite_raw = (detection_score + min(efficiency_score/1000, 1) + min(deployment_score, 1)) / 3
-        print(f"\n  ★ APPROXIMATE COMPOSITE SCORE: {composite_raw:.4f}")
-        print("\n  Note: For accurate comparison, normalize with other models in your dataset.")
+        lines.append(f"\n  ★ APPROXIMATE COMPOSITE SCORE: {composite_raw:.4f}")
+        lines.append("\n  Note: For accurate comparison, normalize with other models in your dataset.")
+        sys.stdout.write("\n".join(lines) + "\n")
     
 
 
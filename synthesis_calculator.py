@@ -10,10 +10,23 @@ This script calculates the final composite score by combining all evaluation dim
 
 Usage:
     python synthesis_calculator.py
+    python synthesis_calculator.py --batch models.json
     
 Then enter your model's metrics when prompted.
 """
 
+import sys
+import json
+import math
+import argparse
+
+import numpy as np
+
+# Report separators
+_BAR70 = "=" * 70
+_DASH70 = "-" * 70
+_DASH55 = "-" * 55
+_DASH40 = "-" * 40
 
 # Default weights (from Table framework_weights)
 WEIGHTS = {
@@ -24,6 +37,20 @@ WEIGHTS = {
     'efficiency': 0.10
 }
 
+# Column order of the (num_models, 5) metric matrix
+METRICS = ('detection', 'asc', 'tco', 'deployment', 'efficiency')
+_W_TUPLE = tuple(WEIGHTS[k] for k in METRICS)
+W_VEC = np.array(_W_TUPLE)
+
+# Columns min-max normalized across models (Detection/ASC are already 0-100),
+# and those where lower raw values are better
+_NORMALIZED = np.array([False, False, True, True, True])
+_INVERSE = np.array([False, False, True, False, False])
+
+# Row of the normalized-scores table, filled from a result dict
+ROW_FMT = ("{name:<25} | {detection_norm:>6.2f} | {asc_norm:>6.2f} | "
+           "{tco_norm:>6.2f} | {deployment_norm:>6.2f} | {efficiency_norm:>6.2f}")
+
 
 def normalize_score(score: float, min_val: float, max_val: float, 
                     inverse: bool = False) -> float:
@@ -69,30 +96,152 @@ def calculate_final_score(detection_norm: float, asc_norm: float, tco_norm: floa
     Returns:
         Final composite score
     """
-    w = weights or WEIGHTS
+    w = _W_TUPLE if not weights or weights is WEIGHTS else tuple(weights[k] for k in METRICS)
+    scores = (detection_norm, asc_norm, tco_norm, deployment_norm, efficiency_norm)
+    
+    return math.fsum(wi * si for wi, si in zip(w, scores))
+
+
+def normalize_matrix(X: np.ndarray) -> np.ndarray:
+    """
+    Normalize a (num_models, 5) metric matrix to 0-100 range in one pass.
+    
+    Detection and ASC are already 0-100 and pass through unchanged; TCO,
+    Deployment and Efficiency are min-max normalized across the models,
+    with TCO inverted (lower cost = higher score).
+    
+    Args:
+        X: Raw metrics, one row per model, columns in METRICS order
+    
+    Returns:
+        Normalized metric matrix (0-100 range)
+    """
+    mn = X.min(axis=0)
+    mx = X.max(axis=0)
+    rng = mx - mn
+    safe_rng = np.where(rng == 0, 1.0, rng)
     
-    return (w['detection'] * detection_norm +
-            w['asc'] * asc_norm +
-            w['tco'] * tco_norm +
-            w['deployment'] * deployment_norm +
-            w['efficiency'] * efficiency_norm)
+    # Fold each column's normalization into a single multiply-add: S*scale + offset
+    scale = np.where(_INVERSE, -100.0, 100.0) / safe_rng
+    offset = np.where(_INVERSE, mx, mn) * -scale
+    scale = np.where(_NORMALIZED, scale, 1.0)
+    offset = np.where(_NORMALIZED, offset, 0.0)
+    
+    norm = np.multiply(X, scale)
+    np.add(norm, offset, out=norm)
+    
+    # Constant columns: best score for TCO, zero for Deployment/Efficiency
+    return np.where(_NORMALIZED & (rng == 0), np.where(_INVERSE, 100.0, 0.0), norm)
 
 
-def main():
-    print("=" * 70)
+def run_batch_vectorized(models: list, weights: dict = WEIGHTS):
+    """
+    Normalize, score and rank a list of models in one vectorized pass,
+    then print the comparison report.
+    
+    Args:
+        models: Model dicts with 'name' (default 'model') and the raw
+                'detection', 'asc', 'tco', 'deployment' and 'efficiency' metrics
+        weights: Optional custom weights dictionary
+    """
+    # Raw metrics are only meaningful relative to other models; a lone model
+    # is scored from pre-normalized values in single-model mode instead
+    if len(models) < 2:
+        print("\n  ⚠️  Comparison needs at least two models; "
+              "use single-model mode to score one model.")
+        return
+    
+    # Normalize all models at once (Structure-of-Arrays layout)
+    X = np.array([[m[k] for k in METRICS] for m in models], dtype=np.float64)
+    norm = normalize_matrix(X)
+    w_vec = W_VEC if weights is WEIGHTS else np.array([weights[k] for k in METRICS])
+    contribs = norm * w_vec   # (N,5) * (5,), per-dimension breakdown for display
+    final_scores = norm @ w_vec
+    
+    # Rank by final score (stable, so ties keep input order)
+    order = np.argsort(-final_scores, kind='stable')
+    
+    results = []
+    for i in order:
+        n = norm[i]
+        results.append({
+            'name': models[i].get('name', 'model'),
+            'detection_norm': n[0],
+            'asc_norm': n[1],
+            'tco_norm': n[2],
+            'deployment_norm': n[3],
+            'efficiency_norm': n[4],
+            'contributions': contribs[i],
+            'final_score': final_scores[i]
+        })
+    
+    # Display results
+    lines = []
+    lines.append("\n" + _BAR70)
+    lines.append("  NORMALIZED SCORES (0-100 Scale)")
+    lines.append(_BAR70)
+    lines.append(f"{'Model':<25} | {'Det.':<7} | {'ASC':<7} | {'TCO':<7} | {'Dep.':<7} | {'Eff.':<7}")
+    lines.append(_DASH70)
+    fmt_row = ROW_FMT.format_map
+    for r in results:
+        lines.append(fmt_row(r))
+    
+    lines.append("\n" + _BAR70)
+    lines.append("  WEIGHTED CONTRIBUTIONS")
+    lines.append(_BAR70)
+    for r in results:
+        det_w, asc_w, tco_w, dep_w, eff_w = r['contributions']
+        
+        lines.append(f"\n{r['name']}:")
+        lines.append(f"  Detection × {weights['detection']:.2f}:    {r['detection_norm']:.2f} × {weights['detection']:.2f} = {det_w:.2f}")
+        lines.append(f"  ASC × {weights['asc']:.2f}:         {r['asc_norm']:.2f} × {weights['asc']:.2f} = {asc_w:.2f}")
+        lines.append(f"  TCO × {weights['tco']:.2f}:         {r['tco_norm']:.2f} × {weights['tco']:.2f} = {tco_w:.2f}")
+        lines.append(f"  Deployment × {weights['deployment']:.2f}:  {r['deployment_norm']:.2f} × {weights['deployment']:.2f} = {dep_w:.2f}")
+        lines.append(f"  Efficiency × {weights['efficiency']:.2f}:  {r['efficiency_norm']:.2f} × {weights['efficiency']:.2f} = {eff_w:.2f}")
+    
+    lines.append("\n" + _BAR70)
+    lines.append("  FINAL RANKINGS")
+    lines.append(_BAR70)
+    lines.append(f"{'Rank':<6} | {'Model':<25} | {'Composite Score':<15}")
+    lines.append(_DASH55)
+    for i, r in enumerate(results, 1):
+        star = " ★" if i == 1 else ""
+        lines.append(f"{i:<6} | {r['name']:<25} | {r['final_score']:>12.2f}{star}")
+    
+    lines.append("\n  Formula: Final = (0.30×Det) + (0.25×ASC) + (0.20×TCO) + (0.15×Dep) + (0.10×Eff)")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Synthesis engine final ranking calculator")
+    parser.add_argument('--batch', metavar='PATH',
+                        help="JSON file with a list of model metrics; '-' reads stdin")
+    args = parser.parse_args(argv)
+    
+    if args.batch:
+        if args.batch == '-':
+            models = json.load(sys.stdin)
+        else:
+            with open(args.batch) as f:
+                models = json.load(f)
+        run_batch_vectorized(models)
+        return
+    
+    print(_BAR70)
     print("  SYNTHESIS ENGINE - FINAL MODEL RANKING CALCULATOR")
-    print("=" * 70)
+    print(_BAR70)
     print("\nThis calculator combines all evaluation dimensions into a final ranking.")
     print("Default weights: Detection(30%), ASC(25%), TCO(20%), Deployment(15%), Efficiency(10%)\n")
     
     # Ask about custom weights
     custom_weights = input("Use default weights? (yes/no): ").strip().lower()
-    weights = WEIGHTS.copy()
+    weights = WEIGHTS
     
     if custom_weights in ['no', 'n']:
-        print("\n" + "-" * 40)
+        weights = WEIGHTS.copy()
+        print("\n" + _DASH40)
         print("CUSTOM WEIGHTS (must sum to 1.0)")
-        print("-" * 40)
+        print(_DASH40)
         weights['detection'] = float(input(f"Detection weight [{weights['detection']}]: ") or weights['detection'])
         weights['asc'] = float(input(f"ASC weight [{weights['asc']}]: ") or weights['asc'])
         weights['tco'] = float(input(f"TCO weight [{weights['tco']}]: ") or weights['tco'])
@@ -107,16 +256,18 @@ def main():
     
     # Determine mode: single model or comparison
     mode = input("\nEvaluate (1) Single model or (2) Compare multiple models? [1/2]: ").strip()
+    num_models = int(input("How many models to compare? ")) if mode == '2' else 1
     
-    if mode == '2':
+    # A one-model "comparison" has nothing to normalize against, so it
+    # takes the single-model path below
+    if num_models != 1:
         # Multiple model comparison
-        num_models = int(input("How many models to compare? "))
         models = []
         
         for i in range(num_models):
-            print(f"\n" + "-" * 40)
+            print(f"\n" + _DASH40)
             print(f"MODEL {i+1} METRICS")
-            print("-" * 40)
+            print(_DASH40)
             name = input(f"Model name: ")
             detection = float(input("  Detection/Accuracy (0-100): "))
             asc = float(input("  ASC Score (0-100): "))
@@ -133,79 +284,13 @@ def main():
                 'efficiency': efficiency
             })
         
-        # Calculate min/max for normalization
-        tco_min = min(m['tco'] for m in models)
-        tco_max = max(m['tco'] for m in models)
-        dep_min = min(m['deployment'] for m in models)
-        dep_max = max(m['deployment'] for m in models)
-        eff_min = min(m['efficiency'] for m in models)
-        eff_max = max(m['efficiency'] for m in models)
-        
-        # Normalize and calculate final scores
-        results = []
-        for m in models:
-            det_norm = m['detection']  # Already in 0-100
-            asc_norm = m['asc']        # Already in 0-100
-            tco_norm = normalize_score(m['tco'], tco_min, tco_max, inverse=True)
-            dep_norm = normalize_score(m['deployment'], dep_min, dep_max)
-            eff_norm = normalize_score(m['efficiency'], eff_min, eff_max)
-            
-            final = calculate_final_score(det_norm, asc_norm, tco_norm, dep_norm, eff_norm, weights)
-            
-            results.append({
-                'name': m['name'],
-                'detection_norm': det_norm,
-                'asc_norm': asc_norm,
-                'tco_norm': tco_norm,
-                'deployment_norm': dep_norm,
-                'efficiency_norm': eff_norm,
-                'final_score': final
-            })
-        
-        # Sort by final score
-        results.sort(key=lambda x: x['final_score'], reverse=True)
-        
-        # Display results
-        print("\n" + "=" * 70)
-        print("  NORMALIZED SCORES (0-100 Scale)")
-        print("=" * 70)
-        print(f"{'Model':<25} | {'Det.':<7} | {'ASC':<7} | {'TCO':<7} | {'Dep.':<7} | {'Eff.':<7}")
-        print("-" * 70)
-        for r in results:
-            print(f"{r['name']:<25} | {r['detection_norm']:>6.2f} | {r['asc_norm']:>6.2f} | "
-                  f"{r['tco_norm']:>6.2f} | {r['deployment_norm']:>6.2f} | {r['efficiency_norm']:>6.2f}")
-        
-        print("\n" + "=" * 70)
-        print("  WEIGHTED CONTRIBUTIONS")
-        print("=" * 70)
-        for r in results:
-            det_w = r['detection_norm'] * weights['detection']
-            asc_w = r['asc_norm'] * weights['asc']
-            tco_w = r['tco_norm'] * weights['tco']
-            dep_w = r['deployment_norm'] * weights['deployment']
-            eff_w = r['efficiency_norm'] * weights['efficiency']
-            
-            print(f"\n{r['name']}:")
-            print(f"  Detection × {weights['detection']:.2f}:    {r['detection_norm']:.2f} × {weights['detection']:.2f} = {det_w:.2f}")
-            print(f"  ASC × {weights['asc']:.2f}:         {r['asc_norm']:.2f} × {weights['asc']:.2f} = {asc_w:.2f}")
-            print(f"  TCO × {weights['tco']:.2f}:         {r['tco_norm']:.2f} × {weights['tco']:.2f} = {tco_w:.2f}")
-            print(f"  Deployment × {weights['deployment']:.2f}:  {r['deployment_norm']:.2f} × {weights['deployment']:.2f} = {dep_w:.2f}")
-            print(f"  Efficiency × {weights['efficiency']:.2f}:  {r['efficiency_norm']:.2f} × {weights['efficiency']:.2f} = {eff_w:.2f}")
-        
-        print("\n" + "=" * 70)
-        print("  FINAL RANKINGS")
-        print("=" * 70)
-        print(f"{'Rank':<6} | {'Model':<25} | {'Composite Score':<15}")
-        print("-" * 55)
-        for i, r in enumerate(results, 1):
-            star = " ★" if i == 1 else ""
-            print(f"{i:<6} | {r['name']:<25} | {r['final_score']:>12.2f}{star}")
+        run_batch_vectorized(models, weights)
         
     else:
         # Single model evaluation
-        print("\n" + "-" * 40)
+        print("\n" + _DASH40)
         print("MODEL METRICS (Already Normalized)")
-        print("-" * 40)
+        print(_DASH40)
         print("Note: For single model, enter pre-normalized scores (0-100 range)")
         
         detection = float(input("Detection score (0-100): "))
@@ -216,41 +301,42 @@ def main():
         
         final = calculate_final_score(detection, asc, tco, deployment, efficiency, weights)
         
-        print("\n" + "=" * 70)
-        print("  WEIGHTED CONTRIBUTIONS")
-        print("=" * 70)
+        lines = []
+        lines.append("\n" + _BAR70)
+        lines.append("  WEIGHTED CONTRIBUTIONS")
+        lines.append(_BAR70)
         det_w = detection * weights['detection']
         asc_w = asc * weights['asc']
         tco_w = tco * weights['tco']
         dep_w = deployment * weights['deployment']
         eff_w = efficiency * weights['efficiency']
         
-        print(f"  Detection × {weights['detection']:.2f}:    {detection:.2f} × {weights['detection']:.2f} = {det_w:.2f}")
-        print(f"  ASC × {weights['asc']:.2f}:         {asc:.2f} × {weights['asc']:.2f} = {asc_w:.2f}")
-        print(f"  TCO × {weights['tco']:.2f}:         {tco:.2f} × {weights['tco']:.2f} = {tco_w:.2f}")
-        print(f"  Deployment × {weights['deployment']:.2f}:  {deployment:.2f} × {weights['deployment']:.2f} = {dep_w:.2f}")
-        print(f"  Efficiency × {weights['efficiency']:.2f}:  {efficiency:.2f} × {weights['efficiency']:.2f} = {eff_w:.2f}")
+        lines.append(f"  Detection × {weights['detection']:.2f}:    {detection:.2f} × {weights['detection']:.2f} = {det_w:.2f}")
+        lines.append(f"  ASC × {weights['asc']:.2f}:         {asc:.2f} × {weights['asc']:.2f} = {asc_w:.2f}")
+        lines.append(f"  TCO × {weights['tco']:.2f}:         {tco:.2f} × {weights['tco']:.2f} = {tco_w:.2f}")
+        lines.append(f"  Deployment × {weights['deployment']:.2f}:  {deployment:.2f} × {weights['deployment']:.2f} = {dep_w:.2f}")
+        lines.append(f"  Efficiency × {weights['efficiency']:.2f}:  {efficiency:.2f} × {weights['efficiency']:.2f} = {eff_w:.2f}")
         
-        print("\n" + "=" * 70)
-        print("  FINAL COMPOSITE SCORE")
-        print("=" * 70)
-        print(f"\n  ★ FINAL SCORE: {final:.2f}")
+        lines.append("\n" + _BAR70)
+        lines.append("  FINAL COMPOSITE SCORE")
+        lines.append(_BAR70)
+        lines.append(f"\n  ★ FINAL SCORE: {final:.2f}")
         
         # Interpretation
-        print("\n" + "-" * 40)
-        print("INTERPRETATION")
-        print("-" * 40)
+        lines.append("\n" + _DASH40)
+        lines.append("INTERPRETATION")
+        lines.append(_DASH40)
         if final >= 78:
-            print("  Excellent - Top-tier model for balanced IIoT deployment")
+            lines.append("  Excellent - Top-tier model for balanced IIoT deployment")
         elif final >= 72:
-            print("  Very Good - Suitable for most deployment scenarios")
+            lines.append("  Very Good - Suitable for most deployment scenarios")
         elif final >= 65:
-            print("  Good - Adequate performance with some trade-offs")
+            lines.append("  Good - Adequate performance with some trade-offs")
         else:
-            print("  Moderate - Consider optimizing specific dimensions")
-    
-
-    print("\n  Formula: Final = (0.30×Det) + (0.25×ASC) + (0.20×TCO) + (0.15×Dep) + (0.10×Eff)")
+            lines.append("  Moderate - Consider optimizing specific dimensions")
+        
+        lines.append("\n  Formula: Final = (0.30×Det) + (0.25×ASC) + (0.20×TCO) + (0.15×Dep) + (0.10×Eff)")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
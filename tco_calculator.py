@@ -10,49 +10,153 @@ This script calculates the 5-year TCO for IDS models based on:
 
 Usage:
     python tco_calculator.py
+    python tco_calculator.py --batch models.json
     
 Then enter your model's metrics when prompted.
 """
 
-# Default cost parameters (can be customized)
-DEFAULT_PARAMS = {
+import sys
+import json
+import argparse
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
+from functools import lru_cache
+
+import numpy as np
+
+# Report separators
+_BAR70 = "=" * 70
+_DASH70 = "-" * 70
+_DASH40 = "-" * 40
+
+
+@dataclass(slots=True, frozen=True)
+class TCOParams:
+    """Cost parameters (customize with dataclasses.replace)."""
     # System parameters
-    'num_devices': 1000,
-    'evaluation_years': 5,
-    'flows_per_device_per_day': 10000,
+    num_devices: int = 1000
+    evaluation_years: int = 5
+    flows_per_device_per_day: int = 10000
     
     # Deployment costs
-    'base_infrastructure': 50000,
-    'hardware_cost_per_mb': 350,
-    'network_cost_edge': 10000,
-    'network_cost_centralized': 50000,
-    'integration_cost_edge': 20000,
-    'integration_cost_dl': 100000,
+    base_infrastructure: float = 50000
+    hardware_cost_per_mb: float = 350
+    network_cost_edge: float = 10000
+    network_cost_centralized: float = 50000
+    integration_cost_edge: float = 20000
+    integration_cost_dl: float = 100000
     
     # Operational costs
-    'retraining_frequency_per_year': 1,
-    'training_compute_rate_per_hour': 2,
-    'inference_compute_rate_per_hour': 0.5,
-    'energy_cost_per_device_5year': 90,
+    retraining_frequency_per_year: float = 1
+    training_compute_rate_per_hour: float = 2
+    inference_compute_rate_per_hour: float = 0.5
+    energy_cost_per_device_5year: float = 90
     
     # Incident response
-    'alert_investigation_time_min': 10,
-    'soc_analyst_rate_per_hour': 75,
+    alert_investigation_time_min: float = 10
+    soc_analyst_rate_per_hour: float = 75
     
     # Scalability
-    'expansion_fee_edge': 80000,
-    'expansion_fee_non_edge': 50000,
+    expansion_fee_edge: float = 80000
+    expansion_fee_non_edge: float = 50000
     
     # Compliance
-    'base_audit_fee': 120000,
-    'interpretability_high': 1.0,
-    'interpretability_medium': 0.5,
-    'interpretability_low': 0.2
-}
+    base_audit_fee: float = 120000
+    interpretability_high: float = 1.0
+    interpretability_medium: float = 0.5
+    interpretability_low: float = 0.2
+    
+    # Derived once from the system parameters (see __post_init__)
+    device_years: float = field(init=False)
+    total_flows: float = field(init=False)
+    
+    def __post_init__(self):
+        device_years = self.num_devices * self.evaluation_years
+        object.__setattr__(self, 'device_years', device_years)
+        object.__setattr__(self, 'total_flows', device_years * 365 * self.flows_per_device_per_day)
+
+
+# Default cost parameters
+DEFAULT_PARAMS = TCOParams()
+
+
+class Interp(IntEnum):
+    """Interpretability level; values index the interpretability lookup tables."""
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+
+
+# Menu choice -> interpretability level
+_INTERP_CHOICES = {'1': Interp.HIGH, '2': Interp.MEDIUM, '3': Interp.LOW}
+
+# Per-model cost breakdown returned by calculate_tco_batch
+TCO_DTYPE = np.dtype([
+    ('deployment', 'f8'),
+    ('operational', 'f8'),
+    ('incident_response', 'f8'),
+    ('scalability', 'f8'),
+    ('compliance', 'f8'),
+    ('total', 'f8')
+])
+
+
+@dataclass(frozen=True)
+class TCOContext:
+    """Per-model-invariant quantities shared by the cost components."""
+    cost_per_alert: float              # SOC cost to investigate one alert
+    training_rate: float               # Cost per second of training time
+    inference_rate: float              # Cost per second of inference time
+    energy_cost: float                 # Fleet energy cost over the evaluation period
+    alert_cost_per_fpr: float          # Incident response cost per unit of FPR
+
+
+@lru_cache(maxsize=16)
+def get_tco_context(params: TCOParams = DEFAULT_PARAMS) -> TCOContext:
+    """
+    Get the shared TCO context for a parameter set, computed once per
+    distinct set of parameters.
+    
+    Args:
+        params: Cost parameters
+    
+    Returns:
+        TCOContext with the precomputed quantities
+    """
+    training_hours = params.device_years * params.retraining_frequency_per_year / 3600
+    inference_hours = params.total_flows / 3600
+    cost_per_alert = (params.alert_investigation_time_min / 60) * params.soc_analyst_rate_per_hour
+    return TCOContext(
+        cost_per_alert=cost_per_alert,
+        training_rate=training_hours * params.training_compute_rate_per_hour,
+        inference_rate=inference_hours * params.inference_compute_rate_per_hour,
+        energy_cost=params.energy_cost_per_device_5year * params.device_years,
+        alert_cost_per_fpr=params.total_flows * cost_per_alert
+    )
+
+
+@lru_cache(maxsize=16)
+def _edge_luts(params: TCOParams) -> tuple:
+    """
+    Build the edge-compatibility lookup tables used by calculate_tco_batch
+    for one parameter set.
+    
+    Returns:
+        Tuple of (network, integration, expansion_fee) read-only 2-entry
+        arrays indexed by int(is_edge_compatible)
+    """
+    luts = (np.array([params.network_cost_centralized, params.network_cost_edge]),
+            np.array([params.integration_cost_dl, params.integration_cost_edge]),
+            np.array([params.expansion_fee_non_edge, params.expansion_fee_edge]))
+    
+    # Shared through the cache, so callers must not modify them
+    for lut in luts:
+        lut.flags.writeable = False
+    return luts
 
 
 def calculate_deployment_cost(model_size_mb: float, is_edge_compatible: bool, 
-                              params: dict = None) -> dict:
+                              params: TCOParams = DEFAULT_PARAMS) -> dict:
     """
     Calculate Deployment Cost (DEP).
     Equation: DEP = C_infra + C_hw + C_net + C_int
@@ -60,17 +164,15 @@ def calculate_deployment_cost(model_size_mb: float, is_edge_compatible: bool,
     Args:
         model_size_mb: Model size in megabytes
         is_edge_compatible: Whether model can be deployed on edge devices
-        params: Cost parameters dictionary
+        params: Cost parameters
     
     Returns:
         Dictionary with cost breakdown and total
     """
-    p = params or DEFAULT_PARAMS
-    
-    c_infra = p['base_infrastructure']
-    c_hw = p['hardware_cost_per_mb'] * model_size_mb
-    c_net = p['network_cost_edge'] if is_edge_compatible else p['network_cost_centralized']
-    c_int = p['integration_cost_edge'] if is_edge_compatible else p['integration_cost_dl']
+    c_infra = params.base_infrastructure
+    c_hw = params.hardware_cost_per_mb * model_size_mb
+    c_net = params.network_cost_edge if is_edge_compatible else params.network_cost_centralized
+    c_int = params.integration_cost_edge if is_edge_compatible else params.integration_cost_dl
     
     total = c_infra + c_hw + c_net + c_int
     
@@ -84,7 +186,7 @@ def calculate_deployment_cost(model_size_mb: float, is_edge_compatible: bool,
 
 
 def calculate_operational_cost(training_time_s: float, inference_time_s: float,
-                               params: dict = None) -> dict:
+                               params: TCOParams = DEFAULT_PARAMS) -> dict:
     """
     Calculate Operational Cost (OP).
     Equation: OP = C_train + C_infer + C_energy
@@ -92,29 +194,21 @@ def calculate_operational_cost(training_time_s: float, inference_time_s: float,
     Args:
         training_time_s: Training time in seconds
         inference_time_s: Inference time in seconds per sample
-        params: Cost parameters dictionary
+        params: Cost parameters
     
     Returns:
         Dictionary with cost breakdown and total
     """
-    p = params or DEFAULT_PARAMS
-    
-    N = p['num_devices']
-    Y = p['evaluation_years']
-    F = p['flows_per_device_per_day']
-    R = p['retraining_frequency_per_year']
+    ctx = get_tco_context(params)
     
     # Training cost
-    training_hours = training_time_s / 3600
-    c_train = training_hours * N * R * Y * p['training_compute_rate_per_hour']
+    c_train = training_time_s * ctx.training_rate
     
     # Inference cost
-    total_flows = F * N * 365 * Y
-    inference_hours = (total_flows * inference_time_s) / 3600
-    c_infer = inference_hours * p['inference_compute_rate_per_hour']
+    c_infer = inference_time_s * ctx.inference_rate
     
     # Energy cost
-    c_energy = p['energy_cost_per_device_5year'] * N * Y
+    c_energy = ctx.energy_cost
     
     total = c_train + c_infer + c_energy
     
@@ -126,42 +220,33 @@ def calculate_operational_cost(training_time_s: float, inference_time_s: float,
     }
 
 
-def calculate_incident_response_cost(fpr: float, params: dict = None) -> dict:
+def calculate_incident_response_cost(fpr: float, params: TCOParams = DEFAULT_PARAMS) -> dict:
     """
     Calculate Incident Response Cost (IR).
     Equation: IR = Total_False_Alerts × Cost_per_Alert
     
     Args:
         fpr: False Positive Rate as decimal
-        params: Cost parameters dictionary
+        params: Cost parameters
     
     Returns:
         Dictionary with cost breakdown and total
     """
-    p = params or DEFAULT_PARAMS
+    ctx = get_tco_context(params)
     
-    N = p['num_devices']
-    Y = p['evaluation_years']
-    F = p['flows_per_device_per_day']
-    
-    total_flows = F * N * 365 * Y
-    false_alerts = fpr * total_flows
-    
-    alert_investigation_hours = p['alert_investigation_time_min'] / 60
-    cost_per_alert = alert_investigation_hours * p['soc_analyst_rate_per_hour']
-    
-    total = false_alerts * cost_per_alert
+    false_alerts = fpr * params.total_flows
+    total = fpr * ctx.alert_cost_per_fpr
     
     return {
-        'total_flows': total_flows,
+        'total_flows': params.total_flows,
         'false_alerts': false_alerts,
-        'cost_per_alert': cost_per_alert,
+        'cost_per_alert': ctx.cost_per_alert,
         'total': total
     }
 
 
 def calculate_scalability_cost(is_edge_compatible: bool, edge_compatibility_score: float,
-                               params: dict = None) -> dict:
+                               params: TCOParams = DEFAULT_PARAMS) -> dict:
     """
     Calculate Scalability Cost (SC).
     Equation: SC = Base_Expansion_Fee × Compatibility_Factor
@@ -169,18 +254,16 @@ def calculate_scalability_cost(is_edge_compatible: bool, edge_compatibility_scor
     Args:
         is_edge_compatible: Whether model can be deployed on edge devices
         edge_compatibility_score: Edge compatibility score (0.2-1.0)
-        params: Cost parameters dictionary
+        params: Cost parameters
     
     Returns:
         Dictionary with cost breakdown and total
     """
-    p = params or DEFAULT_PARAMS
-    
     if is_edge_compatible:
-        base_fee = p['expansion_fee_edge']
+        base_fee = params.expansion_fee_edge
         total = base_fee * edge_compatibility_score
     else:
-        total = p['expansion_fee_non_edge']
+        total = params.expansion_fee_non_edge
         base_fee = total
     
     return {
@@ -190,33 +273,66 @@ def calculate_scalability_cost(is_edge_compatible: bool, edge_compatibility_scor
     }
 
 
-def calculate_compliance_cost(interpretability: str, params: dict = None) -> dict:
+def parse_interp(value) -> Interp:
+    """
+    Parse an interpretability level given as a menu choice or a name.
+    
+    Args:
+        value: 1/2/3 (as int, float or string) or 'high'/'medium'/'low'
+    
+    Returns:
+        The Interp level
+    
+    Raises:
+        ValueError: If the value is not a known level
+    """
+    if isinstance(value, str) and value.strip().upper() in Interp.__members__:
+        return Interp[value.strip().upper()]
+    try:
+        choice = float(value)
+    except (TypeError, ValueError):
+        choice = None
+    if choice not in (1, 2, 3):
+        raise ValueError(f"Invalid interpretability level: {value!r} "
+                         "(expected 1/2/3 or high/medium/low)")
+    return Interp(int(choice) - 1)
+
+
+@lru_cache(maxsize=16)
+def _interp_table(params: TCOParams) -> tuple:
+    """
+    Build the interpretability lookup table for one parameter set.
+    
+    Returns:
+        Tuple of (interpretability_score, opacity_factor) indexed by Interp
+    """
+    scores = (params.interpretability_high, params.interpretability_medium,
+              params.interpretability_low)
+    return tuple((score, 1 / score) for score in scores)
+
+
+def calculate_compliance_cost(interpretability: Interp, params: TCOParams = DEFAULT_PARAMS) -> dict:
     """
     Calculate Compliance Cost (CC).
     Equation: CC = Audit_Fee × Opacity_Factor
     
     Args:
-        interpretability: 'high', 'medium', or 'low'
-        params: Cost parameters dictionary
+        interpretability: Interp level ('high', 'medium' or 'low' also accepted)
+        params: Cost parameters
     
     Returns:
         Dictionary with cost breakdown and total
     """
-    p = params or DEFAULT_PARAMS
-    
-    interp_scores = {
-        'high': p['interpretability_high'],
-        'medium': p['interpretability_medium'],
-        'low': p['interpretability_low']
-    }
+    if isinstance(interpretability, str):
+        interpretability = Interp.__members__.get(interpretability.upper(), Interp.LOW)
     
-    interp_score = interp_scores.get(interpretability.lower(), p['interpretability_low'])
-    opacity_factor = 1 / interp_score
+    table = _interp_table(params)
+    interp_score, opacity_factor = table[interpretability]
     
-    total = p['base_audit_fee'] * opacity_factor
+    total = params.base_audit_fee * opacity_factor
     
     return {
-        'audit_fee': p['base_audit_fee'],
+        'audit_fee': params.base_audit_fee,
         'interpretability_score': interp_score,
         'opacity_factor': opacity_factor,
         'total': total
@@ -234,6 +350,53 @@ def calculate_total_tco(dep: float, op: float, ir: float, sc: float, cc: float)
     return dep + op + ir + sc + cc
 
 
+def calculate_tco_batch(model_size_mb, training_time_s, inference_time_s, fpr,
+                        is_edge_compatible, edge_compatibility_score, interp_idx,
+                        params: TCOParams = DEFAULT_PARAMS) -> np.ndarray:
+    """
+    Calculate the TCO breakdown for N candidate models in one vectorized pass.
+    
+    Args:
+        model_size_mb: Model sizes in megabytes, shape (N,)
+        training_time_s: Training times in seconds, shape (N,)
+        inference_time_s: Inference times in seconds per sample, shape (N,)
+        fpr: False Positive Rates as decimals, shape (N,)
+        is_edge_compatible: Edge deployability flags, shape (N,)
+        edge_compatibility_score: Edge compatibility scores (0.2-1.0), shape (N,)
+        interp_idx: Interp level per model (0=high, 1=medium, 2=low)
+        params: Cost parameters
+    
+    Returns:
+        Structured array of shape (N,) with TCO_DTYPE fields
+    """
+    ctx = get_tco_context(params)
+    
+    sizes = np.asarray(model_size_mb, dtype=np.float64)
+    train_t = np.asarray(training_time_s, dtype=np.float64)
+    infer_t = np.asarray(inference_time_s, dtype=np.float64)
+    fpr = np.asarray(fpr, dtype=np.float64)
+    is_edge = np.asarray(is_edge_compatible, dtype=bool)
+    edge_score = np.asarray(edge_compatibility_score, dtype=np.float64)
+    interp_idx = np.asarray(interp_idx, dtype=np.intp)
+    
+    table = _interp_table(params)
+    opacity_lut = np.array([opacity for _, opacity in table])
+    net_lut, int_lut, exp_lut = _edge_luts(params)
+    edge = is_edge.view(np.uint8)
+    
+    out = np.empty(sizes.shape, dtype=TCO_DTYPE)
+    out['deployment'] = (params.base_infrastructure + params.hardware_cost_per_mb * sizes
+                         + net_lut[edge] + int_lut[edge])
+    out['operational'] = train_t * ctx.training_rate + infer_t * ctx.inference_rate + ctx.energy_cost
+    out['incident_response'] = fpr * ctx.alert_cost_per_fpr
+    out['scalability'] = exp_lut[edge] * np.where(is_edge, edge_score, 1.0)
+    out['compliance'] = params.base_audit_fee * opacity_lut[interp_idx]
+    out['total'] = (out['deployment'] + out['operational'] + out['incident_response']
+                    + out['scalability'] + out['compliance'])
+    return out
+
+
+@lru_cache(maxsize=256)
 def format_currency(amount: float) -> str:
     """Format number as currency string."""
     if amount >= 1000000:
@@ -244,29 +407,89 @@ def format_currency(amount: float) -> str:
         return f"${amount:.2f}"
 
 
-def main():
-    print("=" * 70)
+def run_batch_vectorized(models: list, params: TCOParams = DEFAULT_PARAMS):
+    """
+    Calculate and print the TCO breakdown for a list of models in one
+    vectorized pass.
+    
+    Args:
+        models: Model spec dicts with 'name' (default 'model'), 'model_size',
+                'training_time', 'inference_time', 'fpr', 'is_edge' (yes/no),
+                'edge_score' (default 1.0 for edge models, unused otherwise)
+                and 'interp' (see parse_interp; default 3)
+        params: Cost parameters
+    
+    Raises:
+        ValueError: If a model has an invalid 'interp' level
+    """
+    if not models:
+        print("\n  ⚠️  No models to evaluate.")
+        return
+    
+    is_edge = [str(m['is_edge']).strip().lower() in ['yes', 'y', 'true', '1'] for m in models]
+    r = calculate_tco_batch(
+        [m['model_size'] for m in models],
+        [m['training_time'] for m in models],
+        [m['inference_time'] for m in models],
+        [m['fpr'] for m in models],
+        is_edge,
+        [m.get('edge_score', 1.0 if edge else 0.2) for m, edge in zip(models, is_edge)],
+        [parse_interp(m.get('interp', 3)) for m in models],
+        params
+    )
+    
+    lines = []
+    lines.append("\n" + _BAR70)
+    lines.append(f"  BATCH TCO RESULTS ({len(models)} models)")
+    lines.append(_BAR70)
+    lines.append(f"{'Model':<20} | {'DEP':>8} | {'OP':>8} | {'IR':>8} | {'SC':>8} | {'CC':>8} | {'TCO':>8}")
+    lines.append(_DASH70)
+    for m, row in zip(models, r):
+        costs = " | ".join(f"{format_currency(float(row[k])):>8}" for k in TCO_DTYPE.names)
+        lines.append(f"{m.get('name', 'model'):<20} | {costs}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Total Cost of Ownership (TCO) calculator")
+    parser.add_argument('--batch', metavar='PATH',
+                        help="JSON file with a list of model specs; '-' reads stdin")
+    args = parser.parse_args(argv)
+    
+    if args.batch:
+        if args.batch == '-':
+            models = json.load(sys.stdin)
+        else:
+            with open(args.batch) as f:
+                models = json.load(f)
+        run_batch_vectorized(models)
+        return
+    
+    print(_BAR70)
     print("  TOTAL COST OF OWNERSHIP (TCO) CALCULATOR")
-    print("=" * 70)
+    print(_BAR70)
     print("\nThis calculator computes the 5-year TCO for your IDS model deployment.")
     print("Cost components: DEP + OP + IR + SC + CC\n")
     
     # Ask if user wants to customize parameters
     customize = input("Use default cost parameters? (yes/no): ").strip().lower()
-    params = DEFAULT_PARAMS.copy()
+    params = DEFAULT_PARAMS
     
     if customize in ['no', 'n']:
-        print("\n" + "-" * 40)
+        print("\n" + _DASH40)
         print("CUSTOM SYSTEM PARAMETERS")
-        print("-" * 40)
-        params['num_devices'] = int(input(f"Number of devices [{params['num_devices']}]: ") or params['num_devices'])
-        params['evaluation_years'] = int(input(f"Evaluation period in years [{params['evaluation_years']}]: ") or params['evaluation_years'])
-        params['flows_per_device_per_day'] = int(input(f"Flows per device per day [{params['flows_per_device_per_day']}]: ") or params['flows_per_device_per_day'])
+        print(_DASH40)
+        params = replace(
+            params,
+            num_devices=int(input(f"Number of devices [{params.num_devices}]: ") or params.num_devices),
+            evaluation_years=int(input(f"Evaluation period in years [{params.evaluation_years}]: ") or params.evaluation_years),
+            flows_per_device_per_day=int(input(f"Flows per device per day [{params.flows_per_device_per_day}]: ") or params.flows_per_device_per_day)
+        )
     
     # Get model-specific inputs
-    print("\n" + "-" * 40)
+    print("\n" + _DASH40)
     print("MODEL SPECIFICATIONS")
-    print("-" * 40)
+    print(_DASH40)
     model_size = float(input("Enter Model Size (MB): "))
     training_time = float(input("Enter Training Time (seconds): "))
     inference_time = float(input("Enter Inference Time per sample (seconds): "))
@@ -287,8 +510,7 @@ def main():
     print("  2. Medium (e.g., Hybrid models with some explainability)")
     print("  3. Low (e.g., Deep neural networks, black-box models)")
     interp_choice = input("Select interpretability level [1/2/3]: ").strip()
-    interp_map = {'1': 'high', '2': 'medium', '3': 'low'}
-    interpretability = interp_map.get(interp_choice, 'low')
+    interpretability = _INTERP_CHOICES.get(interp_choice, Interp.LOW)
     
     # Calculate all cost components
     dep_result = calculate_deployment_cost(model_size, is_edge, params)
@@ -303,63 +525,65 @@ def main():
     )
     
     # Display detailed results
-    print("\n" + "=" * 70)
-    print("  DEPLOYMENT COST (DEP) BREAKDOWN")
-    print("=" * 70)
-    print(f"  Infrastructure (C_infra):    {format_currency(dep_result['infrastructure'])}")
-    print(f"  Hardware (C_hw):             {format_currency(dep_result['hardware'])}")
-    print(f"  Network (C_net):             {format_currency(dep_result['network'])}")
-    print(f"  Integration (C_int):         {format_currency(dep_result['integration'])}")
-    print(f"  ─────────────────────────────────────")
-    print(f"  DEPLOYMENT TOTAL:            {format_currency(dep_result['total'])}")
-    
-    print("\n" + "=" * 70)
-    print("  OPERATIONAL COST (OP) BREAKDOWN")
-    print("=" * 70)
-    print(f"  Training (C_train):          {format_currency(op_result['training'])}")
-    print(f"  Inference (C_infer):         {format_currency(op_result['inference'])}")
-    print(f"  Energy (C_energy):           {format_currency(op_result['energy'])}")
-    print(f"  ─────────────────────────────────────")
-    print(f"  OPERATIONAL TOTAL:           {format_currency(op_result['total'])}")
-    
-    print("\n" + "=" * 70)
-    print("  INCIDENT RESPONSE COST (IR) BREAKDOWN")
-    print("=" * 70)
-    print(f"  Total flows over {params['evaluation_years']} years:   {ir_result['total_flows']:,.0f}")
-    print(f"  False alerts (FPR={fpr}):    {ir_result['false_alerts']:,.0f}")
-    print(f"  Cost per alert:              {format_currency(ir_result['cost_per_alert'])}")
-    print(f"  ─────────────────────────────────────")
-    print(f"  INCIDENT RESPONSE TOTAL:     {format_currency(ir_result['total'])}")
-    
-    print("\n" + "=" * 70)
-    print("  SCALABILITY COST (SC) BREAKDOWN")
-    print("=" * 70)
-    print(f"  Base expansion fee:          {format_currency(sc_result['base_fee'])}")
-    print(f"  Compatibility factor:        {sc_result['compatibility_factor']}")
-    print(f"  ─────────────────────────────────────")
-    print(f"  SCALABILITY TOTAL:           {format_currency(sc_result['total'])}")
-    
-    print("\n" + "=" * 70)
-    print("  COMPLIANCE COST (CC) BREAKDOWN")
-    print("=" * 70)
-    print(f"  Base audit fee:              {format_currency(cc_result['audit_fee'])}")
-    print(f"  Interpretability ({interpretability}):    {cc_result['interpretability_score']}")
-    print(f"  Opacity factor (1/interp):   {cc_result['opacity_factor']:.1f}")
-    print(f"  ─────────────────────────────────────")
-    print(f"  COMPLIANCE TOTAL:            {format_currency(cc_result['total'])}")
-    
-    print("\n" + "=" * 70)
-    print("  TOTAL COST OF OWNERSHIP SUMMARY")
-    print("=" * 70)
-    print(f"  Deployment (DEP):            {format_currency(dep_result['total']):>15}")
-    print(f"  Operational (OP):            {format_currency(op_result['total']):>15}")
-    print(f"  Incident Response (IR):      {format_currency(ir_result['total']):>15}")
-    print(f"  Scalability (SC):            {format_currency(sc_result['total']):>15}")
-    print(f"  Compliance (CC):             {format_currency(cc_result['total']):>15}")
-    print(f"  ═══════════════════════════════════════════════════")
-    print(f"\n  ★ {params['evaluation_years']}-YEAR TCO: {format_currency(total_tco)}")
-    print(f"     (${total_tco:,.2f})")
-    
+    lines = []
+    lines.append("\n" + _BAR70)
+    lines.append("  DEPLOYMENT COST (DEP) BREAKDOWN")
+    lines.append(_BAR70)
+    lines.append(f"  Infrastructure (C_infra):    {format_currency(dep_result['infrastructure'])}")
+    lines.append(f"  Hardware (C_hw):             {format_currency(dep_result['hardware'])}")
+    lines.append(f"  Network (C_net):             {format_currency(dep_result['network'])}")
+    lines.append(f"  Integration (C_int):         {format_currency(dep_result['integration'])}")
+    lines.append(f"  ─────────────────────────────────────")
+    lines.append(f"  DEPLOYMENT TOTAL:            {format_currency(dep_result['total'])}")
+    
+    lines.append("\n" + _BAR70)
+    lines.append("  OPERATIONAL COST (OP) BREAKDOWN")
+    lines.append(_BAR70)
+    lines.append(f"  Training (C_train):          {format_currency(op_result['training'])}")
+    lines.append(f"  Inference (C_infer):         {format_currency(op_result['inference'])}")
+    lines.append(f"  Energy (C_energy):           {format_currency(op_result['energy'])}")
+    lines.append(f"  ─────────────────────────────────────")
+    lines.append(f"  OPERATIONAL TOTAL:           {format_currency(op_result['total'])}")
+    
+    lines.append("\n" + _BAR70)
+    lines.append("  INCIDENT RESPONSE COST (IR) BREAKDOWN")
+    lines.append(_BAR70)
+    lines.append(f"  Total flows over {params.evaluation_years} years:   {ir_result['total_flows']:,.0f}")
+    lines.append(f"  False alerts (FPR={fpr}):    {ir_result['false_alerts']:,.0f}")
+    lines.append(f"  Cost per alert:              {format_currency(ir_result['cost_per_alert'])}")
+    lines.append(f"  ─────────────────────────────────────")
+    lines.append(f"  INCIDENT RESPONSE TOTAL:     {format_currency(ir_result['total'])}")
+    
+    lines.append("\n" + _BAR70)
+    lines.append("  SCALABILITY COST (SC) BREAKDOWN")
+    lines.append(_BAR70)
+    lines.append(f"  Base expansion fee:          {format_currency(sc_result['base_fee'])}")
+    lines.append(f"  Compatibility factor:        {sc_result['compatibility_factor']}")
+    lines.append(f"  ─────────────────────────────────────")
+    lines.append(f"  SCALABILITY TOTAL:           {format_currency(sc_result['total'])}")
+    
+    lines.append("\n" + _BAR70)
+    lines.append("  COMPLIANCE COST (CC) BREAKDOWN")
+    lines.append(_BAR70)
+    lines.append(f"  Base audit fee:              {format_currency(cc_result['audit_fee'])}")
+    lines.append(f"  Interpretability ({interpretability.name.lower()}):    {cc_result['interpretability_score']}")
+    lines.append(f"  Opacity factor (1/interp):   {cc_result['opacity_factor']:.1f}")
+    lines.append(f"  ─────────────────────────────────────")
+    lines.append(f"  COMPLIANCE TOTAL:            {format_currency(cc_result['total'])}")
+    
+    lines.append("\n" + _BAR70)
+    lines.append("  TOTAL COST OF OWNERSHIP SUMMARY")
+    lines.append(_BAR70)
+    lines.append(f"  Deployment (DEP):            {format_currency(dep_result['total']):>15}")
+    lines.append(f"  Operational (OP):            {format_currency(op_result['total']):>15}")
+    lines.append(f"  Incident Response (IR):      {format_currency(ir_result['total']):>15}")
+    lines.append(f"  Scalability (SC):            {format_currency(sc_result['total']):>15}")
+    lines.append(f"  Compliance (CC):             {format_currency(cc_result['total']):>15}")
+    lines.append(f"  ═══════════════════════════════════════════════════")
+    lines.append(f"\n  ★ {params.evaluation_years}-YEAR TCO: {format_currency(total_tco)}")
+    lines.append(f"     (${total_tco:,.2f})")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
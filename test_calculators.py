@@ -0,0 +1,180 @@
+"""
+Tests for the batch (vectorized) calculator paths.
+
+Usage:
+    python -m unittest test_calculators
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+import numpy as np
+
+import main_calculator
+import synthesis_calculator
+import tco_calculator
+from tco_calculator import Interp
+
+
+def _scalar_tco(size, train, infer, fpr, is_edge, edge_score, interp):
+    """Total TCO for one model through the scalar calculate_* functions."""
+    return tco_calculator.calculate_total_tco(
+        tco_calculator.calculate_deployment_cost(size, is_edge)['total'],
+        tco_calculator.calculate_operational_cost(train, infer)['total'],
+        tco_calculator.calculate_incident_response_cost(fpr)['total'],
+        tco_calculator.calculate_scalability_cost(is_edge, edge_score)['total'],
+        tco_calculator.calculate_compliance_cost(interp)['total']
+    )
+
+
+def _model(**overrides):
+    """Complete-evaluation inputs for one model, as read from a --config file."""
+    model = {
+        'name': 'A', 'accuracy': 99, 'f1': 98, 'training_time': 100,
+        'inference_time': 0.001, 'model_size': 5, 'is_edge': True,
+        'recall': 99.5, 'fpr': 0.002, 'arch': 1, 'interp': 2
+    }
+    model.update(overrides)
+    return model
+
+
+class TestTCOBatch(unittest.TestCase):
+
+    MODELS = [
+        # size, train, infer, fpr, is_edge, edge_score, interp
+        (25.0, 3600.0, 0.001, 0.0012, True, 0.7, Interp.MEDIUM),
+        (500.0, 5.0, 0.01, 0.02, False, 0.2, Interp.HIGH),
+        (0.5, 10.0, 1e-5, 0.002, True, 1.0, Interp.LOW),
+    ]
+
+    def test_batch_totals_match_scalar_path(self):
+        columns = list(zip(*self.MODELS))
+        batch = tco_calculator.calculate_tco_batch(*columns)
+        for row, model in zip(batch, self.MODELS):
+            self.assertAlmostEqual(row['total'], _scalar_tco(*model), delta=1e-6 * row['total'])
+
+    def test_components_sum_to_total(self):
+        batch = tco_calculator.calculate_tco_batch(*zip(*self.MODELS))
+        parts = sum(batch[name] for name in tco_calculator.TCO_DTYPE.names[:-1])
+        np.testing.assert_allclose(parts, batch['total'])
+
+    def test_batch_runner_parses_flags_and_levels(self):
+        spec = {'name': 'C', 'model_size': 25, 'training_time': 3600,
+                'inference_time': 0.001, 'fpr': 0.0012}
+        out = io.StringIO()
+        with redirect_stdout(out):
+            tco_calculator.run_batch_vectorized([
+                dict(spec, is_edge='false', interp='medium'),
+                dict(spec, is_edge=True, interp=2.0),
+            ])
+        rows = out.getvalue().splitlines()[-2:]
+        self.assertIn('$50.0K', rows[0])    # non-edge flat expansion fee
+        self.assertIn('$80.0K', rows[1])    # edge fee with default score 1.0
+        self.assertIn('$240.0K', rows[0])   # medium interpretability
+
+    def test_parse_interp_rejects_unknown_levels(self):
+        self.assertEqual(tco_calculator.parse_interp('2'), Interp.MEDIUM)
+        self.assertEqual(tco_calculator.parse_interp('low'), Interp.LOW)
+        for bad in (0, 4, 2.5, 'x', None):
+            with self.assertRaises(ValueError):
+                tco_calculator.parse_interp(bad)
+
+    def test_empty_batch_warns(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            tco_calculator.run_batch_vectorized([])
+        self.assertIn('No models to evaluate', out.getvalue())
+
+
+class TestNormalizeMatrix(unittest.TestCase):
+
+    def test_min_max_and_inverse_columns(self):
+        X = np.array([[90.0, 95.0, 1.0e6, 0.5, 0.01],
+                      [92.0, 96.0, 2.0e6, 0.3, 0.02]])
+        norm = synthesis_calculator.normalize_matrix(X)
+        np.testing.assert_allclose(norm[:, :2], X[:, :2])       # passed through
+        np.testing.assert_allclose(norm[:, 2], [100.0, 0.0])    # lower cost is better
+        np.testing.assert_allclose(norm[:, 3], [100.0, 0.0])
+        np.testing.assert_allclose(norm[:, 4], [0.0, 100.0])
+
+    def test_constant_columns(self):
+        X = np.array([[90.0, 95.0, 1.0e6, 0.5, 0.01],
+                      [92.0, 96.0, 1.0e6, 0.5, 0.01]])
+        norm = synthesis_calculator.normalize_matrix(X)
+        np.testing.assert_allclose(norm[:, 2], 100.0)
+        np.testing.assert_allclose(norm[:, 3:], 0.0)
+
+    def test_final_score_matches_batch(self):
+        scores = (90.0, 80.0, 70.0, 60.0, 50.0)
+        self.assertAlmostEqual(synthesis_calculator.calculate_final_score(*scores),
+                               float(np.array(scores) @ synthesis_calculator.W_VEC))
+
+
+class TestSynthesisBatch(unittest.TestCase):
+
+    def _run(self, models):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            synthesis_calculator.run_batch_vectorized(models)
+        return out.getvalue()
+
+    def test_ranking_and_default_name(self):
+        report = self._run([
+            {'detection': 90, 'asc': 95, 'tco': 1.0e6, 'deployment': 0.5, 'efficiency': 0.01},
+            {'name': 'B', 'detection': 92, 'asc': 96, 'tco': 1.2e6, 'deployment': 0.3,
+             'efficiency': 0.02},
+        ])
+        self.assertIn('1      | model', report)
+        self.assertIn('2      | B', report)
+
+    def test_one_model_is_rejected(self):
+        report = self._run([{'name': 'A', 'detection': 90, 'asc': 95, 'tco': 1.0e6,
+                             'deployment': 0.5, 'efficiency': 0.01}])
+        self.assertIn('at least two models', report)
+        self.assertNotIn('FINAL RANKINGS', report)
+
+    def test_empty_list_is_rejected(self):
+        self.assertIn('at least two models', self._run([]))
+
+
+class TestEvaluateBatch(unittest.TestCase):
+
+    def test_string_flags_in_dict_of_arrays(self):
+        data = {key: [value] * 2 for key, value in _model().items() if key != 'name'}
+        data['is_edge'] = ['no', ' Yes ']
+        r = main_calculator.evaluate_batch(data)
+        np.testing.assert_allclose(r['edge_score'], [0.8, 1.0])
+
+    def test_tco_matches_scalar_path(self):
+        r = main_calculator.evaluate_batch([_model(), _model(is_edge=False, model_size=50)])
+        self.assertAlmostEqual(r['tco'][0], _scalar_tco(5, 100, 0.001, 0.002, True, 1.0,
+                                                        Interp.MEDIUM))
+        self.assertAlmostEqual(r['tco'][1], _scalar_tco(50, 100, 0.001, 0.002, False, 0.2,
+                                                        Interp.MEDIUM))
+
+    def test_config_values_are_coerced(self):
+        alone = main_calculator.evaluate_batch([main_calculator._collect_inputs(_model())])
+        mixed = main_calculator.evaluate_batch([
+            main_calculator._collect_inputs(_model()),
+            main_calculator._collect_inputs(_model(name='B', arch='2', interp='1',
+                                                   is_edge='no', save='no')),
+        ])
+        self.assertEqual(mixed['novel_attack'][0], alone['novel_attack'][0])
+        self.assertEqual(mixed['cc_cost'][0], alone['cc_cost'][0])
+        self.assertEqual(mixed['novel_attack'][1], 80)
+        self.assertEqual(mixed['edge_score'][1], 0.8)
+
+    def test_save_flag_is_parsed(self):
+        self.assertFalse(main_calculator._collect_inputs(_model(save='no'))['save'])
+        self.assertTrue(main_calculator._collect_inputs(_model(save='yes'))['save'])
+
+    def test_empty_config_list_warns(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            main_calculator.run_batch_evaluation([])
+        self.assertIn('No models to evaluate', out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()